@@ -1,46 +1,333 @@
+import asyncio
 import boto3
-import json
+import hashlib
+import logging
+import orjson
+import os
+import re
+import textwrap
+import threading
+import time
+import uuid
+from botocore.config import Config
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterator, Union, Final, Mapping
 
-class EventGenerator:
-    """
-    Generates professional event descriptions and volunteer expectations based on input form data.
-    Enhanced with improved prompts for more specific, audience-focused content.
-    Uses AWS Bedrock's Claude model for natural language generation.
-    """
+logger = logging.getLogger(__name__)
+
+class GenerationInterruptedError(RuntimeError):
+    """Raised when a streamed generation fails after part of it has already been yielded."""
+
+# Static instructions for event descriptions. These are identical for every
+# event, so they are sent as a cached prompt prefix (see _invoke_model).
+EVENT_DESC_GUIDELINES = """
+You write event descriptions for NIWC Atlantic outreach and STEM events.
+
+Guidelines:
+1. Begin with a strong opening that clearly states what the event is and its purpose
+2. Include all essential details (what participants will do/learn, when, where, who should attend)
+3. Highlight specific benefits for the target audience
+4. Keep it concise (2-3 paragraphs maximum)
+5. Use professional, engaging language appropriate for a government/military organization
+6. For STEM events, clearly explain the activities students will participate in
+7. For career events, emphasize networking and professional development opportunities
+8. Include any special requirements (materials needed, prerequisites, etc.)
+9. End with a clear call to action (registration information, contact details, etc.)
+10. If applicable, mention that the event is hosted by NIWC Atlantic
+
+Format the description as a cohesive, flowing narrative without headers or labels.
+Focus on being clear, specific, and informative while maintaining a professional tone.
+"""
+
+# Static instructions for volunteer expectations, sent as a cached prompt prefix.
+VOLUNTEER_GUIDELINES = """
+You write volunteer expectations for NIWC Atlantic outreach and STEM events.
+
+Guidelines:
+1. Format as a well-organized document with clear section headers using markdown (# for main headers, ## for subheaders)
+2. Begin with a brief, appreciative introduction thanking volunteers
+3. Include these specific sections:
+   - Preparation: Any pre-event training or preparation required
+   - Arrival and Check-in: Specify exact arrival time (typically 45 minutes before event start) and check-in location
+   - Items to Bring: List specific items volunteers should bring
+   - Responsibilities: Detail specific tasks volunteers will be expected to perform
+   - Schedule: Provide a clear timeline of the volunteer duties, including breaks
+   - Contact Information: Include placeholder for coordinator contact details
+4. For STEM events, include any curriculum details or classroom-specific guidance
+5. For multi-day events, specify expectations for each day
+6. Match the formality and tone to a government/military organization
+7. Include any special instructions related to the specific venue or event type
+8. If applicable, note how volunteers should record their hours (e.g., timecard codes)
+
+Be specific and practical - these instructions need to provide clear guidance for volunteers.
+Focus on concrete details rather than general statements.
+"""
+
+# Per-event prompt templates, filled in with str.format_map. These come last
+# so everything before them is an identical, cacheable prefix.
+EVENT_DESC_PROMPT_TEMPLATE = """
+Generate a professional, clear, and engaging event description for a {event_type} based on the following information:
+
+{event_details}
+
+Follow the guidelines above when writing the description, using the "{example_name}" example as the closest model.
+"""
+
+VOLUNTEER_PROMPT_TEMPLATE = """
+Generate detailed, specific volunteer expectations for the following event:
+
+{event_details}
+
+{description_section}Follow the guidelines above when writing the volunteer expectations, using the "{example_name}" example as the closest model.
+"""
+
+class _PromptFields(dict):
+    """Values for a prompt template; any field that isn't provided renders as an empty string."""
     
-    def __init__(
-        self,
-        model_id: str = 'us.anthropic.claude-3-7-sonnet-20250219-v1:0'
-    ):
-        """
-        Initialize the generator with AWS Bedrock client.
-        
-        Args:
-            model_id (str): The Bedrock model identifier to use
-        """
-        self.bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        self.model_id = model_id
-        
-        # Example descriptions for different event types to help guide generation
-        self.example_descriptions = {
-            "Career Fair": """
+    def __missing__(self, key: str) -> str:
+        return ""
+
+def _format_event_details(details: List[Tuple[str, str]]) -> str:
+    """Format labeled event fields as prompt lines, leaving out empty values."""
+    return "\n".join(f"{label}: {value}" for label, value in details if value)
+
+# Static instructions for generating both documents in a single request.
+COMBINED_GUIDELINES = f"""
+{EVENT_DESC_GUIDELINES}
+{VOLUNTEER_GUIDELINES}
+Respond with a JSON object with keys "description" and "volunteer_expectations",
+containing the event description and the volunteer expectations as strings.
+Do not include any text outside the JSON object.
+"""
+
+# Output token caps per prompt type. Output is generated serially, so a cap sized
+# to the expected length bounds worst-case latency: a 2-3 paragraph description
+# finishes in about 400 tokens. Volunteer expectations for detailed or multi-day
+# events can run well past the examples' length, so they get more headroom
+# rather than being cut off mid-section.
+DESC_MAX_TOKENS = 600
+VOLUNTEER_MAX_TOKENS = 1500
+
+# The combined call has to fit both documents, JSON-escaped, plus the JSON
+# wrapper. A reply cut off at the cap isn't valid JSON and falls back to the
+# template text, so this cap leaves generous headroom rather than being the
+# sum of the two above.
+COMBINED_MAX_TOKENS = 4000
+
+# Models that support prompt caching on Bedrock, with the minimum number of
+# tokens a prefix needs before the model will cache it. Shorter prefixes are
+# processed uncached without any error.
+MIN_CACHEABLE_TOKENS = {
+    "anthropic.claude-3-5-haiku-20241022-v1:0": 2048,
+    "anthropic.claude-3-7-sonnet-20250219-v1:0": 1024,
+    "anthropic.claude-sonnet-4-20250514-v1:0": 1024,
+    "anthropic.claude-opus-4-20250514-v1:0": 1024,
+    "anthropic.claude-opus-4-1-20250805-v1:0": 1024,
+    "anthropic.claude-sonnet-4-5-20250929-v1:0": 1024,
+    "anthropic.claude-haiku-4-5-20251001-v1:0": 4096
+}
+
+# Other models reject requests that contain cache_control, so cache
+# checkpoints are only added for these.
+SUPPORTED_CACHING_MODELS = frozenset(MIN_CACHEABLE_TOKENS)
+
+# Prefixes of cross-region inference profile IDs (e.g. "us.anthropic...")
+_INFERENCE_PROFILE_PREFIXES = frozenset({"us", "eu", "apac", "global", "us-gov", "jp", "au", "ca"})
+
+def _normalize_model_id(model_id: str) -> str:
+    """Strip any cross-region inference profile prefix from a model ID."""
+    prefix, _, base_id = model_id.partition(".")
+    return base_id if prefix in _INFERENCE_PROFILE_PREFIXES else model_id
+
+def _supports_prompt_caching(model_id: str) -> bool:
+    """Return whether a model (or inference profile) supports prompt caching."""
+    return _normalize_model_id(model_id) in SUPPORTED_CACHING_MODELS
+
+# Filler appended to a cached prefix that is shorter than the model's minimum
+_CACHE_PADDING_HEADER = "\nThe lines below only pad this reference text to a cacheable length; ignore them.\n"
+_CACHE_PADDING_LINE = "This line is padding and contains no instructions.\n"
+
+def _estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of English text."""
+    return len(text) // 4
+
+@lru_cache(maxsize=32)
+def _pad_for_caching(prefix: str, model_id: str) -> str:
+    """Pad a static prompt prefix up to the model's minimum cacheable length."""
+    # Token counts are only estimated, so aim a quarter above the minimum to
+    # make sure the prefix actually qualifies
+    target_tokens = MIN_CACHEABLE_TOKENS.get(_normalize_model_id(model_id), 0) * 5 // 4
+    missing_tokens = target_tokens - _estimate_tokens(prefix)
+    if missing_tokens <= 0:
+        return prefix
+    
+    padding_lines = -(-missing_tokens // _estimate_tokens(_CACHE_PADDING_LINE))
+    return prefix + _CACHE_PADDING_HEADER + _CACHE_PADDING_LINE * padding_lines
+
+# Models that offer latency-optimized inference on Bedrock. Requesting it for
+# any other model fails, so those are sent with standard latency up front.
+LATENCY_OPTIMIZED_MODELS = frozenset({
+    "anthropic.claude-3-5-haiku-20241022-v1:0"
+})
+
+# Models that rejected latency-optimized inference anyway (availability also
+# depends on region); these are called with standard latency from then on
+# instead of failing and retrying every time.
+_STANDARD_LATENCY_MODELS = set()
+
+# Bedrock calls are I/O bound, so the pool is sized well above the CPU count;
+# the ThreadPoolExecutor default of cpu_count() + 4 bottlenecks concurrent requests.
+DEFAULT_MAX_WORKERS = (os.cpu_count() or 1) * 5
+_EXECUTOR = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS)
+
+# Bedrock client settings: adaptive retries smooth over throttling, keepalive
+# avoids repeated TLS handshakes, and the larger pool matches concurrent use.
+# Responses are streamed, so the read timeout only has to cover the gap
+# between chunks rather than a whole generation.
+_BEDROCK_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 6},
+    connect_timeout=5,
+    read_timeout=60,
+    tcp_keepalive=True,
+    max_pool_connections=50
+)
+
+DEFAULT_REGION = 'us-east-1'
+
+# Shared Bedrock clients per region, created on first use. boto3 clients are
+# thread-safe and expensive to build, so every EventGenerator reuses them.
+_BEDROCK_CLIENTS = {}
+_BEDROCK_CLIENTS_LOCK = threading.Lock()
+
+def _get_bedrock_client(region_name: str = DEFAULT_REGION):
+    """Return the shared Bedrock runtime client for a region, creating it if needed."""
+    client = _BEDROCK_CLIENTS.get(region_name)
+    if client is None:
+        with _BEDROCK_CLIENTS_LOCK:
+            client = _BEDROCK_CLIENTS.get(region_name)
+            if client is None:
+                client = boto3.client(
+                    'bedrock-runtime',
+                    region_name=region_name,
+                    config=_BEDROCK_CONFIG
+                )
+                _BEDROCK_CLIENTS[region_name] = client
+    return client
+
+class _LRUCache:
+    """A thread-safe mapping that evicts its least recently used entry when full."""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return a cached value and mark it as recently used, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+# In-process cache of model responses, keyed on a hash of the exact request.
+# Regenerating with unchanged inputs (e.g. after editing a field the prompt
+# doesn't use) returns the earlier response without another Bedrock call.
+RESPONSE_CACHE_SIZE = 512
+_RESPONSE_CACHE = _LRUCache(RESPONSE_CACHE_SIZE)
+
+def _response_cache_key(model_id: str, request_body: bytes) -> str:
+    """Build a content-addressed cache key for a Bedrock request."""
+    return hashlib.blake2b(model_id.encode() + b"\0" + request_body).hexdigest()
+
+# Audience inferred from keywords in the event type, checked in order
+_AUDIENCE_RULES = (
+    (("career fair", "job", "internship"), "students and job seekers"),
+    (("stem", "science", "math", "cyber", "robotics", "camp"), "students and educators"),
+    (("workshop", "training", "professional"), "professionals and educators")
+)
+
+# All audience keywords in one alternation, so an event type is scanned in a
+# single pass instead of once per keyword. Alternatives are listed in rule
+# order (regex alternation prefers the earliest), and the lookahead reports a
+# match at every position, so overlapping keywords are all seen.
+def _compile_audience_rules(rules: Tuple[Tuple[Tuple[str, ...], str], ...]) -> Tuple[Dict[str, int], "re.Pattern[str]"]:
+    """Map each audience keyword to its first rule's index and compile the keyword pattern."""
+    term_rules = {}
+    for index, (terms, _) in enumerate(rules):
+        for term in terms:
+            term_rules.setdefault(term, index)
+    pattern = re.compile("(?=(" + "|".join(re.escape(term) for term in term_rules) + "))")
+    return term_rules, pattern
+
+_AUDIENCE_TERM_RULES, _AUDIENCE_PATTERN = _compile_audience_rules(_AUDIENCE_RULES)
+
+@lru_cache(maxsize=64)
+def _target_audience_for(event_type: str) -> str:
+    """Infer the likely target audience for an event type."""
+    # The earliest rule with any keyword in the event type wins
+    rule_indexes = [
+        _AUDIENCE_TERM_RULES[match.group(1)]
+        for match in _AUDIENCE_PATTERN.finditer(event_type.lower())
+    ]
+    if rule_indexes:
+        return _AUDIENCE_RULES[min(rule_indexes)][1]
+    return "participants"
+
+def _compile_example_rules(examples: Mapping[str, str]) -> Tuple[Tuple[str, Tuple[str, ...], str], ...]:
+    """Precompute (lowercased key, key words, key) tuples for example matching."""
+    return tuple((key.lower(), tuple(key.lower().split()), key) for key in examples)
+
+@lru_cache(maxsize=64)
+def _match_example(rules: Tuple[Tuple[str, Tuple[str, ...], str], ...], event_type: str) -> str:
+    """Find the name of the most relevant example for an event type in a single pass over the rules."""
+    event_type_lower = event_type.lower()
+    
+    # A full key match wins; otherwise use the first key that shares a word
+    partial_match = None
+    for key_lower, key_words, key in rules:
+        if key_lower in event_type_lower:
+            return key
+        if partial_match is None and any(word in event_type_lower for word in key_words):
+            partial_match = key
+    
+    if partial_match is not None:
+        return partial_match
+    
+    # Default to the first example if no matches
+    return rules[0][2] if rules else ""
+
+# Example descriptions for different event types to help guide generation
+EXAMPLE_DESCRIPTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "Career Fair": """
             NIWC Atlantic is hosting a Career Fair at Charleston Southern University. This event will showcase career opportunities and allow students to interact with professionals from various fields. Students will have the opportunity to learn about different career paths, required skills, and education requirements. Representatives will be available to discuss internship and job opportunities.
             """,
-            
-            "STEM Activity": """
+    
+    "STEM Activity": """
             NIWC Atlantic regularly hosts targeted STEM Activity sessions. For the Spring of 2025, the activity is Life Budgeting. Life Budgeting is a scenario-based activity where students are randomly assigned a career, salary, family, and credit score. They must use that scenario to make financial decisions such as housing and transportation. Life budgeting is held within a classroom setting, with NIWC Atlantic professionals teaching the curriculum, and is designed to fit within a standard class period. Multiple sessions may be taught in a day.
             """,
-            
-            "Workshop": """
+    
+    "Workshop": """
             Join us for our hands-on Robotics Workshop, designed to introduce students to the fundamentals of robotics engineering. Participants will learn about mechanical design, programming, and problem-solving while building and programming their own robot. This interactive workshop is suitable for students with no prior robotics experience and will give them insight into STEM career pathways.
             """
-        }
-        
-        # Example volunteer expectations for different event types
-        self.example_volunteer_expectations = {
-            "Career Fair": """
+})
+
+# Example volunteer expectations for different event types
+EXAMPLE_VOLUNTEER_EXPECTATIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "Career Fair": """
             # Volunteer Expectations - Career Fair
 
             ## Arrival and Check-in
@@ -71,8 +358,8 @@ class EventGenerator:
             * For questions before the event, contact the Volunteer Coordinator at volunteer.coordinator@example.mil
             * Day-of event questions: Call or text Event Lead at (555) 123-4567
             """,
-            
-            "STEM Activity": """
+    
+    "STEM Activity": """
             # Volunteer Expectations - Life Budgeting STEM Activity
 
             ## Preparation
@@ -119,134 +406,278 @@ class EventGenerator:
             * For questions about the curriculum: education.coordinator@example.mil
             * For day-of logistics: event.lead@example.mil or (555) 987-6543
             """
-        }
+})
+
+# Lowercased example keys and their words, precomputed for event type matching
+_DESCRIPTION_EXAMPLE_RULES = _compile_example_rules(EXAMPLE_DESCRIPTIONS)
+_VOLUNTEER_EXAMPLE_RULES = _compile_example_rules(EXAMPLE_VOLUNTEER_EXPECTATIONS)
+
+def _format_examples(heading: str, examples: Mapping[str, str]) -> str:
+    """Format every example, tagged with its event type, for a cached prompt prefix."""
+    sections = [
+        f'<example event_type="{name}">\n{textwrap.dedent(example).strip()}\n</example>'
+        for name, example in examples.items()
+    ]
+    return f"\n{heading}\n\n" + "\n\n".join(sections) + "\n"
+
+# Cached prompt prefixes: the guidelines followed by every example. Sending all
+# examples keeps each prefix byte-identical across events (and long enough to
+# be cached); the per-event prompt names the example closest to the event type.
+EVENT_DESC_EXAMPLES = _format_examples("Examples of good event descriptions:", EXAMPLE_DESCRIPTIONS)
+VOLUNTEER_EXAMPLES = _format_examples("Examples of good volunteer expectations:", EXAMPLE_VOLUNTEER_EXPECTATIONS)
+EVENT_DESC_PREFIX = EVENT_DESC_GUIDELINES + EVENT_DESC_EXAMPLES
+VOLUNTEER_PREFIX = VOLUNTEER_GUIDELINES + VOLUNTEER_EXAMPLES
+COMBINED_PREFIX = COMBINED_GUIDELINES + EVENT_DESC_EXAMPLES + VOLUNTEER_EXAMPLES
+
+# Bedrock batch inference only accepts jobs with at least this many records;
+# smaller batches are generated on demand instead.
+BATCH_MIN_RECORDS = 100
+
+# Terminal states of a Bedrock model invocation job
+_BATCH_SUCCEEDED_STATUSES = frozenset({"Completed", "PartiallyCompleted"})
+_BATCH_FAILED_STATUSES = frozenset({"Failed", "Stopped", "Expired"})
+
+# Descriptions of earlier events, with their event-specific details replaced by
+# markers, keyed on the event's structure (type, category, venue, audience).
+# Only consulted when EventGenerator is created with reuse_similar=True.
+SIMILAR_DESCRIPTION_CACHE_SIZE = 256
+_SIMILAR_DESCRIPTIONS = _LRUCache(SIMILAR_DESCRIPTION_CACHE_SIZE)
+
+# Event-specific values that are swapped out when a description is reused.
+# A description is only stored if the required ones appear in it verbatim,
+# so a reused description never carries another event's name, place or time.
+_SIMILAR_REQUIRED_FIELDS = ("event_name", "location_name", "time_info")
+_SIMILAR_OPTIONAL_FIELDS = ("street_address", "city", "state")
+
+# Optional values shorter than this (e.g. two-letter state codes) are too likely
+# to turn up in unrelated text to be swapped out safely
+_SIMILAR_MIN_VALUE_LENGTH = 3
+
+@lru_cache(maxsize=256)
+def _whole_word_pattern(value: str) -> "re.Pattern[str]":
+    """Compile a pattern that matches a value only where it isn't part of a longer word."""
+    return re.compile(rf"(?<!\w){re.escape(value)}(?!\w)")
+
+# 12-hour clock without a leading zero ("9:05 AM"). Windows' C runtime spells
+# the no-padding flag "#" rather than "-", so pick the format once at import
+_TIME_FORMAT = "%#I:%M %p" if os.name == "nt" else "%-I:%M %p"
+
+def _fmt_time(dt: datetime) -> str:
+    """Format the time of day of a datetime, e.g. "9:05 AM"."""
+    return dt.strftime(_TIME_FORMAT)
+
+@lru_cache(maxsize=4096)
+def _parse_dt(date_str: str, time_str: str) -> datetime:
+    """Parse a form date ("YYYY-MM-DD") and time ("HH:MM") into a single datetime."""
+    # fromisoformat is implemented in C and avoids strptime's per-call format
+    # parsing; strptime still handles (and reports) anything it rejects
+    try:
+        return datetime.fromisoformat(f"{date_str}T{time_str}")
+    except ValueError:
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+
+def _format_duration(start_datetime: datetime, end_datetime: datetime) -> str:
+    """Format the span between two already-parsed datetimes."""
+    # Same day
+    if start_datetime.date() == end_datetime.date():
+        start_time_formatted = _fmt_time(start_datetime)
+        end_time_formatted = _fmt_time(end_datetime)
+        date_formatted = start_datetime.strftime("%A, %B %d, %Y")
+        return f"{date_formatted}, {start_time_formatted} to {end_time_formatted}"
+    
+    # Multi-day
+    start_formatted = f"{start_datetime.strftime('%A, %B %d, %Y')} at {_fmt_time(start_datetime)}"
+    end_formatted = f"{end_datetime.strftime('%A, %B %d, %Y')} at {_fmt_time(end_datetime)}"
+    return f"{start_formatted} to {end_formatted}"
+
+@lru_cache(maxsize=4096)
+def _format_event_duration(start_date: str, end_date: str,
+                           start_time: str, end_time: str) -> str:
+    """Format the span of an event from its form date and time strings."""
+    try:
+        return _format_duration(_parse_dt(start_date, start_time),
+                                _parse_dt(end_date, end_time))
+    except Exception:
+        logger.exception("Error calculating duration")
+        return f"{start_date} {start_time} to {end_date} {end_time}"
+
+@dataclass(frozen=True)
+class _EventTiming:
+    """An event's parsed start and end, its formatted time span and volunteer arrival time."""
+    start_dt: Optional[datetime]
+    end_dt: Optional[datetime]
+    formatted: str
+    arrival_time: str
+    is_multi_day: bool
+
+@dataclass(frozen=True)
+class _PreparedEvent:
+    """Per-event values derived once from the form data, shared by the prompt and the fallback."""
+    timing: _EventTiming
+    location_details: str
+    venue_description: str
+    recurring_info: str
+    target_audience: str
+    example_name: str
+    
+    @property
+    def time_info(self) -> str:
+        return self.timing.formatted
+
+# Process-wide EventGenerator returned by EventGenerator.get_default()
+_DEFAULT_GENERATOR = None
+_DEFAULT_GENERATOR_LOCK = threading.Lock()
+
+class EventGenerator:
+    """
+    Generates professional event descriptions and volunteer expectations based on input form data.
+    Enhanced with improved prompts for more specific, audience-focused content.
+    Uses AWS Bedrock's Claude model for natural language generation.
+    
+    Instances are not modified after construction, so a single generator can safely
+    serve many concurrent callers; use get_default() to share one per process.
+    """
+    
+    def __init__(
+        self,
+        model_id: str = 'us.anthropic.claude-3-7-sonnet-20250219-v1:0',
+        latency: str = "optimized",
+        volunteer_model_id: str = 'us.anthropic.claude-3-5-haiku-20241022-v1:0',
+        use_cache: bool = True,
+        reuse_similar: bool = False,
+        region_name: str = DEFAULT_REGION
+    ):
+        """
+        Initialize the generator with AWS Bedrock client.
+        
+        Args:
+            model_id (str): The Bedrock model identifier to use for event descriptions
+            latency (str): Bedrock inference latency mode, "optimized" or "standard".
+                Models that don't support optimized latency fall back to standard.
+            volunteer_model_id (str): The Bedrock model identifier to use for the shorter,
+                more formulaic volunteer expectations
+            use_cache (bool): Reuse earlier responses for identical requests instead of
+                calling Bedrock again
+            reuse_similar (bool): Answer description requests for structurally similar
+                events (same type, category, venue and audience) by re-templating an
+                earlier description with the new event's name, location and time
+            region_name (str): AWS region of the Bedrock runtime endpoint
+        """
+        self.bedrock = _get_bedrock_client(region_name)
+        self.region_name = region_name
+        self.model_id = model_id
+        self.latency = latency
+        self.volunteer_model_id = volunteer_model_id
+        self.use_cache = use_cache
+        self.reuse_similar = reuse_similar
+        
+        # The examples never change, so instances share the module-level
+        # mappings and their precomputed matching rules
+        self.example_descriptions = EXAMPLE_DESCRIPTIONS
+        self.example_volunteer_expectations = EXAMPLE_VOLUNTEER_EXPECTATIONS
+        self._description_example_rules = _DESCRIPTION_EXAMPLE_RULES
+        self._volunteer_example_rules = _VOLUNTEER_EXAMPLE_RULES
+    
+    @classmethod
+    def get_default(cls) -> "EventGenerator":
+        """Return the process-wide generator with default settings, creating it if needed."""
+        global _DEFAULT_GENERATOR
+        if _DEFAULT_GENERATOR is None:
+            with _DEFAULT_GENERATOR_LOCK:
+                if _DEFAULT_GENERATOR is None:
+                    _DEFAULT_GENERATOR = cls()
+        return _DEFAULT_GENERATOR
     
     def _format_datetime(self, date_str: str, time_str: str) -> str:
         """Format date and time strings into a readable format."""
         try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            time_obj = datetime.strptime(time_str, "%H:%M").time()
+            dt = _parse_dt(date_str, time_str)
             
             # Format the date nicely
-            date_formatted = date_obj.strftime("%A, %B %d, %Y")
+            date_formatted = dt.strftime("%A, %B %d, %Y")
             
             # Format the time with AM/PM
-            time_formatted = time_obj.strftime("%I:%M %p").lstrip("0")
+            time_formatted = _fmt_time(dt)
             
             return f"{date_formatted} at {time_formatted}"
-        except Exception as e:
-            print(f"Error formatting date/time: {e}")
+        except Exception:
+            logger.exception("Error formatting date/time")
             return f"{date_str} at {time_str}"
     
     def _get_event_duration(self, start_date: str, end_date: str, 
                            start_time: str, end_time: str) -> str:
         """Calculate and format the event duration."""
-        try:
-            start_datetime = datetime.strptime(f"{start_date} {start_time}", "%Y-%m-%d %H:%M")
-            end_datetime = datetime.strptime(f"{end_date} {end_time}", "%Y-%m-%d %H:%M")
-            
-            # Same day
-            if start_date == end_date:
-                start_time_formatted = start_datetime.strftime("%I:%M %p").lstrip("0")
-                end_time_formatted = end_datetime.strftime("%I:%M %p").lstrip("0")
-                date_formatted = start_datetime.strftime("%A, %B %d, %Y")
-                return f"{date_formatted}, {start_time_formatted} to {end_time_formatted}"
-            
-            # Multi-day
-            start_formatted = start_datetime.strftime("%A, %B %d, %Y at %I:%M %p").lstrip("0")
-            end_formatted = end_datetime.strftime("%A, %B %d, %Y at %I:%M %p").lstrip("0")
-            return f"{start_formatted} to {end_formatted}"
-            
-        except Exception as e:
-            print(f"Error calculating duration: {e}")
-            return f"{start_date} {start_time} to {end_date} {end_time}"
+        # The same event is formatted several times per generation, so the
+        # result is memoized at module level
+        return _format_event_duration(start_date, end_date, start_time, end_time)
     
-    def _get_relevant_example(self, event_type: str) -> str:
-        """Find the most relevant example description based on event type."""
-        # Convert event type to lowercase for matching
-        event_type_lower = event_type.lower()
+    def _get_event_timing(self, event_data: Dict[str, Any]) -> _EventTiming:
+        """Parse and format the event's start and end once, for reuse across a generation."""
+        start_date = event_data.get("start_date", "")
+        end_date = event_data.get("end_date", "")
+        start_time = event_data.get("start_time", "")
+        end_time = event_data.get("end_time", "")
+        
+        try:
+            start_dt = _parse_dt(start_date, start_time)
+        except ValueError:
+            start_dt = None
+        try:
+            end_dt = _parse_dt(end_date, end_time)
+        except ValueError:
+            end_dt = None
         
-        # Check for partial matches in the example descriptions
-        for key, example in self.example_descriptions.items():
-            if key.lower() in event_type_lower:
-                return example
+        # Format straight from the parsed datetimes; the string-keyed path is
+        # only needed for its fallback text when parsing failed
+        if start_dt and end_dt:
+            formatted = _format_duration(start_dt, end_dt)
+        else:
+            formatted = self._get_event_duration(start_date, end_date, start_time, end_time)
         
-        # If no match found, try to find partial matches
-        for key, example in self.example_descriptions.items():
-            if any(word in event_type_lower for word in key.lower().split()):
-                return example
+        # Calculate arrival time (30-60 min before event)
+        arrival_time = ""
+        if start_dt:
+            arrival_time = _fmt_time(start_dt - timedelta(minutes=45))  # Default to 45 min before
+        elif start_date and start_time:
+            arrival_time = "45 minutes before the event start time"
         
-        # Default to a general example or the first one if no matches
-        return list(self.example_descriptions.values())[0] if self.example_descriptions else ""
+        return _EventTiming(
+            start_dt=start_dt,
+            end_dt=end_dt,
+            formatted=formatted,
+            arrival_time=arrival_time,
+            is_multi_day=start_date != end_date
+        )
+    
+    def _get_relevant_example(self, event_type: str) -> str:
+        """Find the name of the most relevant example description based on event type."""
+        return _match_example(self._description_example_rules, event_type)
     
     def _get_relevant_volunteer_example(self, event_type: str) -> str:
-        """Find the most relevant volunteer expectations example based on event type."""
-        # Convert event type to lowercase for matching
-        event_type_lower = event_type.lower()
-        
-        # Check for matches in the example volunteer expectations
-        for key, example in self.example_volunteer_expectations.items():
-            if key.lower() in event_type_lower:
-                return example
-        
-        # If no match found, try to find partial matches
-        for key, example in self.example_volunteer_expectations.items():
-            if any(word in event_type_lower for word in key.lower().split()):
-                return example
-        
-        # Default to a general example or the first one if no matches
-        return list(self.example_volunteer_expectations.values())[0] if self.example_volunteer_expectations else ""
+        """Find the name of the most relevant volunteer expectations example based on event type."""
+        return _match_example(self._volunteer_example_rules, event_type)
     
     def _get_target_audience(self, event_type: str) -> str:
         """Infer the likely target audience based on event type."""
-        event_type_lower = event_type.lower()
-        
-        if any(term in event_type_lower for term in ["career fair", "job", "internship"]):
-            return "students and job seekers"
-        elif any(term in event_type_lower for term in ["stem", "science", "math", "cyber", "robotics", "camp"]):
-            return "students and educators"
-        elif any(term in event_type_lower for term in ["workshop", "training", "professional"]):
-            return "professionals and educators"
-        else:
-            return "participants"
+        return _target_audience_for(event_type)
     
-    def generate_event_description(self, event_data: Dict[str, Any]) -> str:
-        """
-        Generate a professional event description based on the provided form data.
-        
-        Args:
-            event_data (Dict[str, Any]): Dictionary containing event information
-            
-        Returns:
-            str: Generated event description
-        """
-        # Extract key information
-        event_name = event_data.get("event_name", "")
+    def _prepare_event_data(self, event_data: Dict[str, Any]) -> _PreparedEvent:
+        """Derive the formatted per-event values used by the description prompt and fallback."""
         event_type = event_data.get("event_type", "")
-        location_name = event_data.get("location_name", "")
-        street_address = event_data.get("street_address", "")
-        city = event_data.get("city", "")
-        state = event_data.get("state", "")
-        
-        # Format time and dates
-        time_info = self._get_event_duration(
-            event_data.get("start_date", ""),
-            event_data.get("end_date", ""),
-            event_data.get("start_time", ""),
-            event_data.get("end_time", "")
-        )
         
         # Format location details
-        location_parts = [p for p in [location_name, street_address, city, state] if p]
-        location_details = ", ".join(location_parts)
+        location_parts = [
+            event_data.get("location_name", ""),
+            event_data.get("street_address", ""),
+            event_data.get("city", ""),
+            event_data.get("state", "")
+        ]
+        location_details = ", ".join(p for p in location_parts if p)
         
         # Determine event venue description
         venue_type = event_data.get("venue_type", "")
         venue_description = f"This event will be held {venue_type.lower()}." if venue_type else ""
-            
-        # Add the event category for context
-        event_category = event_data.get("event_category", "Standard Event")
-            
+        
         # Recurring event info
         recurring_info = ""
         if event_data.get("is_recurring", "No") == "Yes":
@@ -255,64 +686,183 @@ class EventGenerator:
                 dates_formatted = ", ".join(recurring_dates)
                 recurring_info = f"This is a recurring event with additional dates: {dates_formatted}."
         
-        # Get relevant example
-        example_description = self._get_relevant_example(event_type)
-        
-        # Infer target audience
-        target_audience = self._get_target_audience(event_type)
-        
-        # Create enhanced prompt for the LLM
-        prompt = f"""
-        Generate a professional, clear, and engaging event description for a {event_type} based on the following information:
-        
-        Event Name: {event_name}
-        Event Type: {event_type}
-        Event Category: {event_category}
-        Location: {location_details}
-        When: {time_info}
-        Venue Type: {venue_description}
-        Recurring Information: {recurring_info}
-        Target Audience: {target_audience}
-        
-        Here's an example of a good description for a similar type of event:
-        {example_description}
-        
-        Guidelines:
-        1. Begin with a strong opening that clearly states what the event is and its purpose
-        2. Include all essential details (what participants will do/learn, when, where, who should attend)
-        3. Highlight specific benefits for the target audience
-        4. Keep it concise (2-3 paragraphs maximum)
-        5. Use professional, engaging language appropriate for a government/military organization
-        6. For STEM events, clearly explain the activities students will participate in
-        7. For career events, emphasize networking and professional development opportunities
-        8. Include any special requirements (materials needed, prerequisites, etc.)
-        9. End with a clear call to action (registration information, contact details, etc.)
-        10. If applicable, mention that the event is hosted by NIWC Atlantic
-        
-        Format the description as a cohesive, flowing narrative without headers or labels.
-        Focus on being clear, specific, and informative while maintaining a professional tone.
+        return _PreparedEvent(
+            timing=self._get_event_timing(event_data),
+            location_details=location_details,
+            venue_description=venue_description,
+            recurring_info=recurring_info,
+            target_audience=self._get_target_audience(event_type),
+            example_name=self._get_relevant_example(event_type)
+        )
+    
+    def _build_event_description_prompt(self, event_data: Dict[str, Any],
+                                        prepared: Optional[_PreparedEvent] = None) -> str:
+        """Build the per-event part of the event description prompt."""
+        prepared = prepared or self._prepare_event_data(event_data)
+        event_type = event_data.get("event_type", "")
+        
+        # Add the event category for context
+        event_category = event_data.get("event_category", "Standard Event")
+        
+        # Fill in the enhanced prompt for the LLM
+        # Empty fields are left out entirely rather than sent as bare labels
+        event_details = _format_event_details([
+            ("Event Name", event_data.get("event_name", "")),
+            ("Event Type", event_type),
+            ("Event Category", event_category),
+            ("Location", prepared.location_details),
+            ("When", prepared.time_info),
+            ("Venue Type", prepared.venue_description),
+            ("Recurring Information", prepared.recurring_info),
+            ("Target Audience", prepared.target_audience)
+        ])
+        
+        return EVENT_DESC_PROMPT_TEMPLATE.format_map(_PromptFields(
+            event_type=event_type,
+            event_details=event_details,
+            example_name=prepared.example_name
+        ))
+    
+    def generate_event_description(self, event_data: Dict[str, Any],
+                                   stream: bool = False) -> Union[str, Iterator[str]]:
+        """
+        Generate a professional event description based on the provided form data.
+        
+        Args:
+            event_data (Dict[str, Any]): Dictionary containing event information
+            stream (bool): If True, return an iterator that yields the description
+                as it is generated instead of waiting for the full text
+            
+        Returns:
+            Union[str, Iterator[str]]: Generated event description, or an iterator
+                over its chunks when streaming
+            
+        Raises:
+            GenerationInterruptedError: If streaming and the stream fails after part
+                of the description has been yielded
         """
+        # Dates, location and example are prepared once and shared by the
+        # prompt and the fallback
+        return self._generate_event_description(event_data, self._prepare_event_data(event_data), stream)
+    
+    def _generate_event_description(self, event_data: Dict[str, Any], prepared: _PreparedEvent,
+                                    stream: bool = False) -> Union[str, Iterator[str]]:
+        """Generate an event description from already-prepared event values."""
+        timing = prepared.timing
+        
+        # A similar earlier event's description can be re-templated locally
+        if self.reuse_similar:
+            reused = self._reuse_similar_description(event_data, timing)
+            if reused is not None:
+                return iter([reused]) if stream else reused
+        
+        prompt = self._build_event_description_prompt(event_data, prepared)
+        
+        # Only descriptions that finished normally are kept as templates, so a
+        # reply cut off at max_tokens is never reused
+        remember = None
+        if self.reuse_similar:
+            remember = lambda text: self._remember_similar_description(event_data, timing, text.strip())
+        
+        if stream:
+            return self._stream_with_fallback(
+                self._invoke_model_stream(
+                    prompt,
+                    prefix=EVENT_DESC_PREFIX,
+                    max_tokens=DESC_MAX_TOKENS,
+                    on_complete=remember
+                ),
+                lambda: self._create_fallback_description(event_data, prepared),
+                "Error generating event description"
+            )
         
         # Call the LLM
         try:
-            response = self._invoke_model(prompt)
-            return response.strip()
-        except Exception as e:
-            print(f"Error generating event description: {e}")
-            return self._create_fallback_description(event_data)
+            return self._invoke_model(
+                prompt,
+                prefix=EVENT_DESC_PREFIX,
+                max_tokens=DESC_MAX_TOKENS,
+                on_complete=remember
+            ).strip()
+        except Exception:
+            logger.exception("Error generating event description")
+            return self._create_fallback_description(event_data, prepared)
     
-    def _create_fallback_description(self, event_data: Dict[str, Any]) -> str:
+    def _similar_event_key(self, event_data: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+        """Key an event by the fields that shape its description, or None if it can't be reused."""
+        # Recurring events list their specific dates, which can't be re-templated
+        if event_data.get("is_recurring", "No") == "Yes":
+            return None
+        
+        event_type = event_data.get("event_type", "")
+        return (
+            event_type.lower(),
+            event_data.get("event_category", "Standard Event"),
+            event_data.get("venue_type", ""),
+            self._get_target_audience(event_type)
+        )
+    
+    def _similar_event_fields(self, event_data: Dict[str, Any], timing: _EventTiming) -> Dict[str, str]:
+        """Collect the event-specific values that differ between similar events."""
+        fields = {name: event_data.get(name, "") for name in _SIMILAR_REQUIRED_FIELDS + _SIMILAR_OPTIONAL_FIELDS}
+        fields["time_info"] = timing.formatted
+        return fields
+    
+    def _remember_similar_description(self, event_data: Dict[str, Any], timing: _EventTiming,
+                                      description: str) -> None:
+        """Store a generated description as a template for similar events, if it is safe to reuse."""
+        key = self._similar_event_key(event_data)
+        fields = self._similar_event_fields(event_data, timing)
+        if key is None or not description:
+            return
+        
+        # Every required detail must be present verbatim so that it can be swapped out
+        if not all(fields[name] and _whole_word_pattern(fields[name]).search(description)
+                   for name in _SIMILAR_REQUIRED_FIELDS):
+            return
+        
+        # Replace longer values first so that e.g. a city inside the location name
+        # doesn't break up the longer match. Values are only replaced as whole
+        # words, so a state code inside an unrelated word is left alone.
+        template = description
+        for name, value in sorted(fields.items(), key=lambda item: len(item[1]), reverse=True):
+            if not value:
+                continue
+            pattern = _whole_word_pattern(value)
+            if name in _SIMILAR_OPTIONAL_FIELDS and len(value) < _SIMILAR_MIN_VALUE_LENGTH:
+                # Too short to swap out safely; if it stands on its own, the
+                # description would carry this event's value into other events
+                if pattern.search(template):
+                    return
+                continue
+            template = pattern.sub(f"<<{name}>>", template)
+        _SIMILAR_DESCRIPTIONS.put(key, template)
+    
+    def _reuse_similar_description(self, event_data: Dict[str, Any], timing: _EventTiming) -> Optional[str]:
+        """Fill a similar event's description template with this event's details, or return None."""
+        key = self._similar_event_key(event_data)
+        template = _SIMILAR_DESCRIPTIONS.get(key) if key is not None else None
+        if template is None:
+            return None
+        
+        description = template
+        for name, value in self._similar_event_fields(event_data, timing).items():
+            marker = f"<<{name}>>"
+            if marker in description:
+                if not value:
+                    return None
+                description = description.replace(marker, value)
+        return description
+    
+    def _create_fallback_description(self, event_data: Dict[str, Any],
+                                     prepared: Optional[_PreparedEvent] = None) -> str:
         """Create a simple description if the LLM call fails."""
         event_name = event_data.get("event_name", "Our upcoming event")
         event_type = event_data.get("event_type", "")
-        location = f"{event_data.get('location_name', '')}, {event_data.get('city', '')}, {event_data.get('state', '')}"
         
-        time_info = self._get_event_duration(
-            event_data.get("start_date", ""),
-            event_data.get("end_date", ""),
-            event_data.get("start_time", ""),
-            event_data.get("end_time", "")
-        )
+        prepared = prepared or self._prepare_event_data(event_data)
+        location = prepared.location_details
+        time_info = prepared.time_info
         
         return f"""
         Join us for {event_name}, a {event_type} event. 
@@ -321,102 +871,102 @@ class EventGenerator:
         
         For more information or to register, please contact the event coordinator.
         """
+    
+    def _build_volunteer_expectations_prompt(self, event_data: Dict[str, Any],
+                                             event_description: Optional[str] = None,
+                                             timing: Optional[_EventTiming] = None) -> str:
+        """Build the per-event part of the volunteer expectations prompt."""
+        event_name = event_data.get("event_name", "")
+        event_type = event_data.get("event_type", "")
+        timing = timing or self._get_event_timing(event_data)
+        
+        # The description is optional so the volunteer prompt doesn't have to
+        # wait for the description to be generated first
+        description_section = f"Event Description:\n{event_description}\n\n" if event_description else ""
+        
+        # Fill in the enhanced prompt for the LLM
+        # Empty fields are left out entirely rather than sent as bare labels
+        event_details = _format_event_details([
+            ("Event Name", event_name),
+            ("Event Type", event_type),
+            ("When", timing.formatted),
+            ("Suggested Volunteer Arrival Time", timing.arrival_time),
+            ("Multi-day Event", "Yes" if timing.is_multi_day else "No")
+        ])
         
-    def generate_volunteer_expectations(self, event_data: Dict[str, Any], event_description: str) -> str:
+        return VOLUNTEER_PROMPT_TEMPLATE.format_map(_PromptFields(
+            event_details=event_details,
+            description_section=description_section,
+            example_name=self._get_relevant_volunteer_example(event_type)
+        ))
+        
+    def generate_volunteer_expectations(self, event_data: Dict[str, Any],
+                                        event_description: Optional[str] = None,
+                                        stream: bool = False) -> Union[str, Iterator[str]]:
         """
         Generate detailed volunteer expectations based on event data and description.
         
         Args:
             event_data (Dict[str, Any]): Dictionary containing event information
-            event_description (str): The final event description
+            event_description (Optional[str]): The final event description, if available
+            stream (bool): If True, return an iterator that yields the expectations
+                as they are generated instead of waiting for the full text
             
         Returns:
-            str: Generated volunteer expectations
+            Union[str, Iterator[str]]: Generated volunteer expectations, or an iterator
+                over their chunks when streaming
+            
+        Raises:
+            GenerationInterruptedError: If streaming and the stream fails after part
+                of the expectations have been yielded
         """
-        event_name = event_data.get("event_name", "")
-        event_type = event_data.get("event_type", "")
-        
-        # Calculate arrival time (30-60 min before event)
-        arrival_time = ""
-        try:
-            start_date = event_data.get("start_date", "")
-            start_time = event_data.get("start_time", "")
-            if start_date and start_time:
-                start_datetime = datetime.strptime(f"{start_date} {start_time}", "%Y-%m-%d %H:%M")
-                arrival_datetime = start_datetime - timedelta(minutes=45)  # Default to 45 min before
-                arrival_time = arrival_datetime.strftime("%I:%M %p").lstrip("0")
-        except Exception:
-            arrival_time = "45 minutes before the event start time"
-        
-        # Format the event time information
-        time_info = self._get_event_duration(
-            event_data.get("start_date", ""),
-            event_data.get("end_date", ""),
-            event_data.get("start_time", ""),
-            event_data.get("end_time", "")
+        return self._generate_volunteer_expectations(
+            event_data, event_description, self._get_event_timing(event_data), stream
         )
+    
+    def _generate_volunteer_expectations(self, event_data: Dict[str, Any],
+                                         event_description: Optional[str],
+                                         timing: _EventTiming,
+                                         stream: bool = False) -> Union[str, Iterator[str]]:
+        """Generate volunteer expectations from already-parsed event timing."""
+        prompt = self._build_volunteer_expectations_prompt(event_data, event_description, timing)
         
-        # Determine if it's a single day or multi-day event
-        is_multi_day = event_data.get("start_date") != event_data.get("end_date")
-        
-        # Get relevant volunteer expectations example
-        example_expectations = self._get_relevant_volunteer_example(event_type)
-        
-        # Create enhanced prompt for the LLM
-        prompt = f"""
-        Generate detailed, specific volunteer expectations for the following event:
-        
-        Event Name: {event_name}
-        Event Type: {event_type}
-        When: {time_info}
-        Suggested Volunteer Arrival Time: {arrival_time}
-        Multi-day Event: {"Yes" if is_multi_day else "No"}
-        
-        Event Description: 
-        {event_description}
-        
-        Here's an example of good volunteer expectations for a similar type of event:
-        {example_expectations}
-        
-        Guidelines:
-        1. Format as a well-organized document with clear section headers using markdown (# for main headers, ## for subheaders)
-        2. Begin with a brief, appreciative introduction thanking volunteers
-        3. Include these specific sections:
-           - Preparation: Any pre-event training or preparation required
-           - Arrival and Check-in: Specify exact arrival time (typically 45 minutes before event start) and check-in location
-
-           - Items to Bring: List specific items volunteers should bring
-           - Responsibilities: Detail specific tasks volunteers will be expected to perform
-           - Schedule: Provide a clear timeline of the volunteer duties, including breaks
-           - Contact Information: Include placeholder for coordinator contact details
-        4. For STEM events, include any curriculum details or classroom-specific guidance
-        5. For multi-day events, specify expectations for each day
-        6. Match the formality and tone to a government/military organization
-        7. Include any special instructions related to the specific venue or event type
-        8. If applicable, note how volunteers should record their hours (e.g., timecard codes)
-        
-        Be specific and practical - these instructions need to provide clear guidance for volunteers.
-        Focus on concrete details rather than general statements.
-        """
+        if stream:
+            return self._stream_with_fallback(
+                self._invoke_model_stream(
+                    prompt,
+                    prefix=VOLUNTEER_PREFIX,
+                    model_id=self.volunteer_model_id,
+                    max_tokens=VOLUNTEER_MAX_TOKENS
+                ),
+                lambda: self._create_fallback_volunteer_expectations(event_data, timing),
+                "Error generating volunteer expectations"
+            )
         
         # Call the LLM
         try:
-            response = self._invoke_model(prompt)
+            response = self._invoke_model(
+                prompt,
+                prefix=VOLUNTEER_PREFIX,
+                model_id=self.volunteer_model_id,
+                max_tokens=VOLUNTEER_MAX_TOKENS
+            )
             return response.strip()
-        except Exception as e:
-            print(f"Error generating volunteer expectations: {e}")
-            return self._create_fallback_volunteer_expectations(event_data)
+        except Exception:
+            logger.exception("Error generating volunteer expectations")
+            return self._create_fallback_volunteer_expectations(event_data, timing)
     
-    def _create_fallback_volunteer_expectations(self, event_data: Dict[str, Any]) -> str:
+    def _create_fallback_volunteer_expectations(self, event_data: Dict[str, Any],
+                                                timing: Optional[_EventTiming] = None) -> str:
         """Create simple volunteer expectations if the LLM call fails."""
         event_name = event_data.get("event_name", "the event")
         
-        # Calculate arrival time (45 min before event)
-        try:
-            start_time = datetime.strptime(event_data.get("start_time", "09:00"), "%H:%M")
-            arrival_time = (start_time - timedelta(minutes=45)).strftime("%I:%M %p").lstrip("0")
-        except:
-            arrival_time = "45 minutes before the event start time"
+        # Reuse the arrival time already worked out for the prompt when the
+        # start parsed; otherwise calculate it (45 min before event) from the time alone
+        if timing and timing.start_dt:
+            arrival_time = timing.arrival_time
+        else:
+            arrival_time = self._fallback_arrival_time(event_data)
         
         return f"""
         # Volunteer Expectations for {event_name}
@@ -450,37 +1000,437 @@ class EventGenerator:
         * On the day of the event, report to the volunteer check-in desk
         """
     
-    def _invoke_model(self, prompt: str) -> str:
-        """Call the AWS Bedrock model with the given prompt."""
+    def _fallback_arrival_time(self, event_data: Dict[str, Any]) -> str:
+        """Work out the arrival time from the start time alone, for events whose start didn't parse."""
+        try:
+            start_time = datetime.strptime(event_data.get("start_time", "09:00"), "%H:%M")
+            return _fmt_time(start_time - timedelta(minutes=45))
+        except ValueError:
+            return "45 minutes before the event start time"
+    
+    def generate_event_bundle(self, event_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Generate the event description, then volunteer expectations that build on it.
+        
+        The event's dates, arrival time and other derived values are computed once
+        and shared by both calls and their fallbacks.
+        
+        Args:
+            event_data (Dict[str, Any]): Dictionary containing event information
+            
+        Returns:
+            Dict[str, str]: Dictionary with "description" and "volunteer_expectations" keys
+        """
+        prepared = self._prepare_event_data(event_data)
+        description = self._generate_event_description(event_data, prepared)
+        volunteer_expectations = self._generate_volunteer_expectations(
+            event_data, description, prepared.timing
+        )
+        return {
+            "description": description,
+            "volunteer_expectations": volunteer_expectations
+        }
+    
+    def generate_all(self, event_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Generate the event description and volunteer expectations in a single LLM call.
+        
+        Both documents share most of their context, so asking for them together
+        avoids a second round-trip and a second pass over the shared prompt.
+        
+        Args:
+            event_data (Dict[str, Any]): Dictionary containing event information
+            
+        Returns:
+            Dict[str, str]: Dictionary with "description" and "volunteer_expectations" keys
+        """
+        # Dates are parsed once and shared by both halves of the prompt
+        prepared = self._prepare_event_data(event_data)
+        prompt = (
+            self._build_event_description_prompt(event_data, prepared)
+            + self._build_volunteer_expectations_prompt(event_data, timing=prepared.timing)
+        )
+        
+        # Call the LLM
+        try:
+            response = self._invoke_model(
+                prompt,
+                prefix=COMBINED_PREFIX,
+                max_tokens=COMBINED_MAX_TOKENS,
+                validate=self._parse_combined_response
+            )
+            return self._parse_combined_response(response)
+        except Exception:
+            logger.exception("Error generating event content")
+            return {
+                "description": self._create_fallback_description(event_data, prepared),
+                "volunteer_expectations": self._create_fallback_volunteer_expectations(event_data, prepared.timing)
+            }
+    
+    def _parse_json_response(self, response: str) -> Dict[str, Any]:
+        """Parse a JSON object from a model response, ignoring markdown code fences."""
+        text = response.strip()
+        if text.startswith("```"):
+            # Drop the opening fence (and its language tag) and the closing fence
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            text = text.rsplit("```", 1)[0]
+        return orjson.loads(text)
+    
+    def _parse_combined_response(self, response: str) -> Dict[str, str]:
+        """Parse a generate_all response, raising ValueError unless it has both documents as strings."""
+        result = self._parse_json_response(response)
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected a JSON object, got {type(result).__name__}")
+        
+        parsed = {}
+        for key in ("description", "volunteer_expectations"):
+            value = result.get(key)
+            if not isinstance(value, str):
+                raise ValueError(f"Expected a string for {key!r}, got {type(value).__name__}")
+            parsed[key] = value.strip()
+        return parsed
+    
+    def generate_batch(self, events: List[Dict[str, Any]],
+                       max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate event descriptions for many events concurrently.
+        
+        Args:
+            events (List[Dict[str, Any]]): Event information dictionaries
+            max_workers (Optional[int]): Number of concurrent Bedrock requests,
+                defaults to DEFAULT_MAX_WORKERS
+            
+        Returns:
+            List[str]: Generated event descriptions, in the same order as events
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS) as executor:
+            return list(executor.map(self.generate_event_description, events))
+    
+    def generate_event_descriptions_batch(self, events: List[Dict[str, Any]], s3_bucket: str,
+                                          role_arn: str, s3_prefix: str = "event-descriptions",
+                                          poll_interval: float = 60,
+                                          timeout: float = 24 * 60 * 60) -> List[str]:
+        """
+        Generate event descriptions for many events with a Bedrock batch inference job.
+        
+        Batch inference is cheaper per token than on-demand calls but runs
+        asynchronously, so this blocks until the job finishes. Batches smaller than
+        BATCH_MIN_RECORDS, which Bedrock won't accept, are generated on demand with
+        generate_batch instead.
+        
+        Args:
+            events (List[Dict[str, Any]]): Event information dictionaries
+            s3_bucket (str): S3 bucket for the job's input and output files
+            role_arn (str): IAM role Bedrock assumes to read and write the bucket
+            s3_prefix (str): Key prefix for the job's files within the bucket
+            poll_interval (float): Seconds between job status checks
+            timeout (float): Seconds to wait for the job before giving up
+            
+        Returns:
+            List[str]: Generated event descriptions, in the same order as events
+        """
+        if len(events) < BATCH_MIN_RECORDS:
+            return self.generate_batch(events)
+        
+        s3 = boto3.client('s3', region_name=self.region_name)
+        bedrock = boto3.client('bedrock', region_name=self.region_name)
+        job_name = f"event-descriptions-{uuid.uuid4().hex[:12]}"
+        input_key = f"{s3_prefix}/input/{job_name}.jsonl"
+        
+        # One JSONL record per event; record IDs map outputs back to their events.
+        # Batch jobs don't use prompt caching, so no cache checkpoints are added.
+        records = []
+        prepared_events = [self._prepare_event_data(event_data) for event_data in events]
+        for index, (event_data, prepared) in enumerate(zip(events, prepared_events)):
+            request = self._build_request(
+                self.model_id,
+                self._build_event_description_prompt(event_data, prepared),
+                EVENT_DESC_PREFIX,
+                DESC_MAX_TOKENS,
+                cache_checkpoints=False
+            )
+            records.append(orjson.dumps({"recordId": f"{index:011d}", "modelInput": request}))
+        s3.put_object(Bucket=s3_bucket, Key=input_key, Body=b"\n".join(records))
+        
+        job_arn = bedrock.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=role_arn,
+            modelId=self.model_id,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": f"s3://{s3_bucket}/{input_key}"}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": f"s3://{s3_bucket}/{s3_prefix}/output/"}}
+        )["jobArn"]
+        logger.info("Started batch inference job %s for %d events", job_arn, len(events))
+        
+        # Wait for the job to reach a terminal state
+        deadline = time.monotonic() + timeout
+        while True:
+            status = bedrock.get_model_invocation_job(jobIdentifier=job_arn)["status"]
+            if status in _BATCH_SUCCEEDED_STATUSES:
+                break
+            if status in _BATCH_FAILED_STATUSES:
+                raise RuntimeError(f"Batch inference job {job_arn} ended with status {status}")
+            if time.monotonic() > deadline:
+                # Stop the job so it doesn't keep running (and billing) for output
+                # nothing will read
+                try:
+                    bedrock.stop_model_invocation_job(jobIdentifier=job_arn)
+                except Exception:
+                    logger.exception("Failed to stop batch inference job %s", job_arn)
+                raise TimeoutError(f"Batch inference job {job_arn} still {status} after {timeout} seconds")
+            time.sleep(poll_interval)
+        
+        # Output is written to <output prefix>/<job id>/<input file name>.out
+        job_id = job_arn.rsplit("/", 1)[-1]
+        output_key = f"{s3_prefix}/output/{job_id}/{job_name}.jsonl.out"
+        output = s3.get_object(Bucket=s3_bucket, Key=output_key)["Body"].read()
+        
+        descriptions = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            content = (record.get("modelOutput") or {}).get("content", [])
+            if content and 'text' in content[0]:
+                descriptions[int(record["recordId"])] = content[0]['text'].strip()
+            else:
+                logger.warning("Batch record %s failed: %s", record.get("recordId"), record.get("error"))
+        
+        # Records that failed within the job get the usual fallback description
+        return [
+            descriptions[index] if index in descriptions
+            else self._create_fallback_description(event_data, prepared)
+            for index, (event_data, prepared) in enumerate(zip(events, prepared_events))
+        ]
+    
+    async def generate_both(self, event_data: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Generate the event description and volunteer expectations concurrently.
+        
+        The volunteer expectations are generated from the event data alone, so
+        both Bedrock calls run at the same time instead of back to back.
+        
+        Args:
+            event_data (Dict[str, Any]): Dictionary containing event information
+            
+        Returns:
+            Tuple[str, str]: Generated event description and volunteer expectations
+        """
+        loop = asyncio.get_running_loop()
+        description, volunteer_expectations = await asyncio.gather(
+            loop.run_in_executor(_EXECUTOR, self.generate_event_description, event_data),
+            loop.run_in_executor(_EXECUTOR, self.generate_volunteer_expectations, event_data)
+        )
+        return description, volunteer_expectations
+    
+    async def agenerate_all(self, event_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Async counterpart of generate_all that overlaps two Bedrock calls.
+        
+        Keeps the separate description and volunteer prompts (and the faster
+        volunteer model) while returning the same result shape as generate_all.
+        
+        Args:
+            event_data (Dict[str, Any]): Dictionary containing event information
+            
+        Returns:
+            Dict[str, str]: Dictionary with "description" and "volunteer_expectations" keys
+        """
+        description, volunteer_expectations = await self.generate_both(event_data)
+        return {
+            "description": description,
+            "volunteer_expectations": volunteer_expectations
+        }
+    
+    def _call_bedrock(self, model_id: str, request_body: bytes) -> Dict[str, Any]:
+        """Send a streaming request to Bedrock, preferring latency-optimized inference."""
+        invoke = self.bedrock.invoke_model_with_response_stream
+        latency = self.latency
+        if (_normalize_model_id(model_id) not in LATENCY_OPTIMIZED_MODELS
+                or model_id in _STANDARD_LATENCY_MODELS):
+            latency = "standard"
+        
         try:
-            # Prepare the request body
-            request_body = json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 2000,
-                "temperature": 0.4,  # Slightly lower temperature for more consistent outputs
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ]
-            })
+            return invoke(
+                modelId=model_id,
+                contentType='application/json',
+                accept='application/json',
+                body=request_body,
+                performanceConfigLatency=latency
+            )
+        except self.bedrock.exceptions.ValidationException:
+            if latency == "standard":
+                raise
             
-            # Make the API call
-            response = self.bedrock.invoke_model(
-                modelId=self.model_id,
+            # Not every model supports optimized latency; retry with standard and
+            # only remember the model once the standard request succeeds
+            response = invoke(
+                modelId=model_id,
                 contentType='application/json',
                 accept='application/json',
-                body=request_body
+                body=request_body,
+                performanceConfigLatency="standard"
             )
+            logger.info("Latency-optimized inference unavailable for %s; using standard latency", model_id)
+            _STANDARD_LATENCY_MODELS.add(model_id)
+            return response
+    
+    def _build_request_body(self, model_id: str, prompt: str, prefix: str,
+                            max_tokens: int) -> bytes:
+        """Build the serialized Anthropic messages request body for a prompt."""
+        return orjson.dumps(self._build_request(model_id, prompt, prefix, max_tokens))
+    
+    def _build_request(self, model_id: str, prompt: str, prefix: str,
+                       max_tokens: int, cache_checkpoints: bool = True) -> Dict[str, Any]:
+        """Build the Anthropic messages request for a prompt."""
+        # The static prefix goes first as a single block ending in a cache
+        # checkpoint, padded up to the model's minimum cacheable length
+        content = []
+        if prefix:
+            if cache_checkpoints and _supports_prompt_caching(model_id):
+                content.append({
+                    "type": "text",
+                    "text": _pad_for_caching(prefix, model_id),
+                    "cache_control": {"type": "ephemeral"}
+                })
+            else:
+                content.append({"type": "text", "text": prefix})
+        content.append({"type": "text", "text": prompt})
+        
+        return {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": 0.4,  # Slightly lower temperature for more consistent outputs
+            "messages": [
+                {"role": "user", "content": content}
+            ]
+        }
+    
+    def _invoke_model(self, prompt: str, prefix: str = "",
+                      model_id: Optional[str] = None, max_tokens: int = 2000,
+                      validate: Optional[Callable[[str], Any]] = None,
+                      on_complete: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Call the AWS Bedrock model with the given prompt.
+        
+        The response is streamed and assembled here, so long generations keep the
+        connection active instead of idling until the whole response is ready.
+        
+        Args:
+            prompt (str): The per-call part of the prompt
+            prefix (str): Static text (guidelines, examples) sent ahead of the
+                prompt and marked as a prompt-cache checkpoint
+            model_id (Optional[str]): Bedrock model to call, defaults to self.model_id
+            max_tokens (int): Maximum number of tokens to generate
+            validate (Optional[Callable[[str], Any]]): Check run on the complete response
+                before it is cached; responses it raises on are not cached
+            on_complete (Optional[Callable[[str], None]]): Called with the response once
+                it has finished normally (end_turn) and passed validate
             
-            # Parse the response
-            response_body = json.loads(response['body'].read())
-            content = response_body.get('content', [])
+        Returns:
+            str: The model's text response
+        """
+        return "".join(self._invoke_model_stream(
+            prompt, prefix, model_id, max_tokens, validate, on_complete
+        ))
+    
+    def _invoke_model_stream(self, prompt: str, prefix: str = "",
+                             model_id: Optional[str] = None, max_tokens: int = 2000,
+                             validate: Optional[Callable[[str], Any]] = None,
+                             on_complete: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+        """
+        Call the AWS Bedrock model and yield the response text as it is generated.
+        
+        Args:
+            prompt (str): The per-call part of the prompt
+            prefix (str): Static text (guidelines, examples) sent ahead of the
+                prompt and marked as a prompt-cache checkpoint
+            model_id (Optional[str]): Bedrock model to call, defaults to self.model_id
+            max_tokens (int): Maximum number of tokens to generate
+            validate (Optional[Callable[[str], Any]]): Check run on the complete response
+                before it is cached; responses it raises on are not cached
+            on_complete (Optional[Callable[[str], None]]): Called with the response once
+                it has finished normally (end_turn) and passed validate
             
-            if content and isinstance(content, list) and 'text' in content[0]:
-                return content[0]['text']
-            else:
-                print("Unexpected response format from the model.")
-                return ""
+        Yields:
+            str: Chunks of the model's text response
+        """
+        try:
+            model_id = model_id or self.model_id
+            request_body = self._build_request_body(model_id, prompt, prefix, max_tokens)
+            
+            # A cached response is yielded whole
+            cache_key = _response_cache_key(model_id, request_body)
+            if self.use_cache:
+                cached = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    yield cached
+                    if on_complete is not None:
+                        on_complete(cached)
+                    return
+            
+            response = self._call_bedrock(model_id, request_body)
+            
+            # Each chunk is one Anthropic streaming event; only text deltas carry output
+            chunks = []
+            stop_reason = None
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if not chunk:
+                    continue
+                data = orjson.loads(chunk['bytes'])
+                event_type = data.get('type')
                 
+                if event_type == 'content_block_delta':
+                    text = data.get('delta', {}).get('text')
+                    if text:
+                        chunks.append(text)
+                        yield text
+                elif event_type == 'message_delta':
+                    stop_reason = data.get('delta', {}).get('stop_reason', stop_reason)
+                elif event_type == 'message_start':
+                    # Report prompt cache activity so cache hits can be verified
+                    usage = data.get('message', {}).get('usage', {})
+                    cache_read = usage.get('cache_read_input_tokens', 0)
+                    cache_write = usage.get('cache_creation_input_tokens', 0)
+                    if cache_read or cache_write:
+                        logger.debug("Prompt cache: %s tokens read, %s tokens written", cache_read, cache_write)
+            
+            if not chunks:
+                logger.warning("Unexpected response format from the model.")
+            elif stop_reason != 'end_turn':
+                logger.warning("Model stopped with reason %s; response not cached", stop_reason)
+            else:
+                # Only complete responses that pass validation are cached or
+                # handed to on_complete
+                response_text = "".join(chunks)
+                try:
+                    if validate is not None:
+                        validate(response_text)
+                except Exception:
+                    logger.warning("Response failed validation; not cached")
+                else:
+                    if self.use_cache:
+                        _RESPONSE_CACHE.put(cache_key, response_text)
+                    if on_complete is not None:
+                        on_complete(response_text)
+                        
+        except Exception as e:
+            # Re-raised for the caller to handle, so the traceback is logged there
+            logger.error("An error occurred while streaming from the model: %s", e)
+            raise
+    
+    def _stream_with_fallback(self, chunks: Iterator[str], fallback: Callable[[], str],
+                              error_message: str) -> Iterator[str]:
+        """Yield streamed chunks, or the fallback text if the stream fails before any output."""
+        started = False
+        try:
+            for chunk in chunks:
+                started = True
+                yield chunk
         except Exception as e:
-            print(f"An error occurred while invoking the model: {e}")
-            raise
\ No newline at end of file
+            logger.exception(error_message)
+            if started:
+                # The caller already has part of the text; ending quietly would
+                # pass the fragment off as the complete result
+                raise GenerationInterruptedError(error_message) from e
+            yield fallback()
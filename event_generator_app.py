@@ -1,8 +1,30 @@
 import streamlit as st
 from datetime import datetime, timedelta
+import atexit
+import logging
 import os
 import json
-from event_generator import EventGenerator
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from event_generator import EventGenerator, GenerationInterruptedError
+
+@st.cache_resource
+def configure_logging():
+    """Route generator logs through a queue so they are written off the request thread."""
+    # Streamlit reruns this script on every interaction; cache_resource makes
+    # sure the listener is only started once per process
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger = logging.getLogger("event_generator")
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return listener
 
 def initialize_session_state():
     """Initialize session state variables if they don't exist."""
@@ -15,6 +37,18 @@ def initialize_session_state():
     if "volunteer_expectations" not in st.session_state:
         st.session_state.volunteer_expectations = ""
 
+def stream_generated_text(chunks, retry_label):
+    """Show generated text as it streams in, returning it, or None if the stream broke off."""
+    placeholder = st.empty()
+    try:
+        with placeholder.container():
+            return st.write_stream(chunks)
+    except GenerationInterruptedError:
+        # Don't keep a partial result; clear it and let the user retry
+        placeholder.empty()
+        st.error(f"Generation was interrupted before it finished. Click \"{retry_label}\" to try again.")
+        return None
+
 def save_event_data():
     """Save form data to session state and navigate to description page."""
     # Collect all form data
@@ -41,9 +75,15 @@ def save_event_data():
         "recurring_dates": st.session_state.get("recurring_dates", [])
     }
     
-    # Generate description
-    generator = EventGenerator()
-    st.session_state.event_description = generator.generate_event_description(st.session_state.event_data)
+    # Generate description, showing it as it streams in
+    generator = EventGenerator.get_default()
+    event_description = stream_generated_text(
+        generator.generate_event_description(st.session_state.event_data, stream=True),
+        "Generate Event Description"
+    )
+    if event_description is None:
+        return
+    st.session_state.event_description = event_description
     
     # Navigate to description page
     st.session_state.page = "description"
@@ -54,11 +94,18 @@ def save_description():
     st.session_state.event_description = st.session_state.edited_description
     
     # Generate volunteer expectations
-    generator = EventGenerator()
-    st.session_state.volunteer_expectations = generator.generate_volunteer_expectations(
-        st.session_state.event_data, 
-        st.session_state.event_description
+    generator = EventGenerator.get_default()
+    volunteer_expectations = stream_generated_text(
+        generator.generate_volunteer_expectations(
+            st.session_state.event_data, 
+            st.session_state.event_description,
+            stream=True
+        ),
+        "Generate Volunteer Expectations"
     )
+    if volunteer_expectations is None:
+        return
+    st.session_state.volunteer_expectations = volunteer_expectations
     
     # Navigate to volunteer expectations page
     st.session_state.page = "volunteer"
@@ -305,6 +352,9 @@ def main():
         layout="wide"
     )
     
+    # Start background logging
+    configure_logging()
+    
     # Initialize session state
     initialize_session_state()
     
@@ -0,0 +1,116 @@
+import unittest
+from unittest import mock
+
+import orjson
+
+import event_generator
+from event_generator import EventGenerator
+
+
+class FakeBedrock:
+    """Stands in for the Bedrock runtime client, streaming a fixed reply."""
+
+    def __init__(self, text, stop_reason="end_turn"):
+        self.text = text
+        self.stop_reason = stop_reason
+        self.calls = 0
+
+    def invoke_model_with_response_stream(self, **kwargs):
+        self.calls += 1
+        events = [
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": self.text}},
+            {"type": "message_delta", "delta": {"stop_reason": self.stop_reason}},
+            {"type": "message_stop"}
+        ]
+        return {"body": [{"chunk": {"bytes": orjson.dumps(event)}} for event in events]}
+
+
+class SimilarDescriptionTest(unittest.TestCase):
+    """Tests for re-templating descriptions of structurally similar events."""
+
+    def setUp(self):
+        # Each test starts with an empty template cache
+        patcher = mock.patch.object(event_generator, "_SIMILAR_DESCRIPTIONS", event_generator._LRUCache(8))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.generator = EventGenerator(use_cache=False, reuse_similar=True)
+
+    def make_event(self, **overrides):
+        event_data = {
+            "event_name": "Small Business Day",
+            "event_type": "Workshop",
+            "location_name": "Charleston Library",
+            "city": "Charleston",
+            "state": "SC",
+            "start_date": "2025-03-01",
+            "end_date": "2025-03-01",
+            "start_time": "09:00",
+            "end_time": "12:00"
+        }
+        event_data.update(overrides)
+        return event_data
+
+    def remember(self, event_data, description):
+        timing = self.generator._get_event_timing(event_data)
+        self.generator._remember_similar_description(event_data, timing, description)
+
+    def reuse(self, event_data):
+        timing = self.generator._get_event_timing(event_data)
+        return self.generator._reuse_similar_description(event_data, timing)
+
+    def test_values_inside_other_words_are_not_replaced(self):
+        first = self.make_event()
+        time_info = self.generator._get_event_timing(first).formatted
+        self.remember(first, (
+            f"Join us for Small Business Day at Charleston Library on {time_info}. "
+            "Participants will meet SCORE mentors from around Charleston."
+        ))
+
+        second = self.make_event(
+            event_name="Startup Clinic",
+            location_name="Richmond Public Library",
+            city="Richmond",
+            state="VA",
+            start_date="2025-04-05",
+            end_date="2025-04-05"
+        )
+        reused = self.reuse(second)
+
+        self.assertIsNotNone(reused)
+        self.assertIn("meet SCORE mentors from around Richmond.", reused)
+        self.assertIn("Startup Clinic at Richmond Public Library", reused)
+        self.assertNotIn("VAORE", reused)
+
+    def test_short_value_standing_alone_is_not_stored(self):
+        first = self.make_event()
+        time_info = self.generator._get_event_timing(first).formatted
+        self.remember(first, (
+            f"Join us for Small Business Day at Charleston Library in Charleston, SC on {time_info}."
+        ))
+
+        # Leaving "SC" in the template would put it into other states' events
+        self.assertIsNone(self.reuse(self.make_event(event_name="Startup Clinic", state="VA")))
+
+    def test_truncated_reply_is_not_stored(self):
+        first = self.make_event()
+        time_info = self.generator._get_event_timing(first).formatted
+        text = f"Join us for Small Business Day at Charleston Library on {time_info}. Students will"
+        self.generator.bedrock = FakeBedrock(text, stop_reason="max_tokens")
+        self.generator.generate_event_description(first)
+
+        self.assertIsNone(self.reuse(self.make_event(event_name="Startup Clinic")))
+
+    def test_finished_reply_is_stored(self):
+        first = self.make_event()
+        time_info = self.generator._get_event_timing(first).formatted
+        text = f"Join us for Small Business Day at Charleston Library on {time_info}."
+        self.generator.bedrock = FakeBedrock(text)
+        "".join(self.generator.generate_event_description(first, stream=True))
+
+        reused = self.generator.generate_event_description(self.make_event(event_name="Startup Clinic"))
+        self.assertTrue(reused.startswith("Join us for Startup Clinic at Charleston Library"))
+        self.assertEqual(self.generator.bedrock.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()